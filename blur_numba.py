@@ -0,0 +1,75 @@
+import numpy as np
+from numba import config, njit, prange, set_num_threads
+
+# Images may be blurred from several Python threads at once, so Numba must use a thread-safe
+# threading layer (TBB or OpenMP) for its parallel loops.
+config.THREADING_LAYER = 'threadsafe'
+
+# Number of output rows produced per tile
+TILE_ROWS = 64
+
+# Size budget in bytes of a tile's float32 scratch buffer. It is kept well below a typical per-core L2 cache,
+# so the intermediate rows are still cached when the vertical pass reads them back.
+TILE_BYTES = 256 * 1024
+
+@njit(parallel=True, fastmath=True, cache=True)
+def sep_gauss_u8(img, k1d, out):
+    """
+    Applies a separable Gaussian blur to an 8-bit image of shape (height, width, channels).
+    The image is processed in tiles of `TILE_ROWS` rows and as many columns as fit the `TILE_BYTES` budget. For each
+    tile the horizontal pass writes into a small float32 scratch buffer (the tile plus the rows the kernel reaches above
+    and below it), and the vertical pass immediately reads it back and writes the result to `out` as 8-bit with
+    saturation. The intermediate image is therefore never written to main memory as a whole, also for wide images.
+    Edge pixels are repeated at the borders, like `cv2.BORDER_REPLICATE`. Tiles are processed in parallel with `prange`.
+    """
+    h, w, c = img.shape
+    k = k1d.shape[0]
+    r = k // 2
+    tile_cols = min(max(TILE_BYTES // ((TILE_ROWS + 2 * r) * c * 4), 16), w)
+    num_tile_rows = (h + TILE_ROWS - 1) // TILE_ROWS
+    num_tile_cols = (w + tile_cols - 1) // tile_cols
+
+    for tile in prange(num_tile_rows * num_tile_cols):
+        y0 = (tile // num_tile_cols) * TILE_ROWS
+        y1 = min(y0 + TILE_ROWS, h)
+        x0 = (tile % num_tile_cols) * tile_cols
+        x1 = min(x0 + tile_cols, w)
+        tmp = np.empty((y1 - y0 + 2 * r, x1 - x0, c), dtype=np.float32)
+
+        # Horizontal pass: tmp[t, x - x0] holds the horizontally filtered image row `y0 - r + t` at column `x`
+        for t in range(tmp.shape[0]):
+            y = min(max(y0 - r + t, 0), h - 1)
+            for x in range(x0, x1):
+                for ch in range(c):
+                    acc = np.float32(0.0)
+                    for i in range(k):
+                        xx = min(max(x + i - r, 0), w - 1)
+                        acc += k1d[i] * img[y, xx, ch]
+                    tmp[t, x - x0, ch] = acc
+
+        # Vertical pass
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                for ch in range(c):
+                    acc = np.float32(0.0)
+                    for i in range(k):
+                        acc += k1d[i] * tmp[y - y0 + i, x - x0, ch]
+                    v = acc + np.float32(0.5)
+                    if v >= 255.0:
+                        out[y, x, ch] = 255
+                    elif v <= 0.0:
+                        out[y, x, ch] = 0
+                    else:
+                        out[y, x, ch] = np.uint8(v)
+
+def limit_threads(count):
+    """
+    Limits the number of threads that parallel loops started from the calling thread may use.
+    The setting only applies to the calling thread, so it is meant to be called at the start of a worker thread
+    that already runs in parallel with other workers.
+    """
+    set_num_threads(count)
+
+# Compiles the kernel when the module is imported, so the first blur the user asks for does not wait for the JIT.
+_warmup = np.zeros((4, 4, 1), dtype=np.uint8)
+sep_gauss_u8(_warmup, np.ones(3, dtype=np.float32) / 3, np.empty_like(_warmup))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+blur_numba = pytest.importorskip('blur_numba')
+
+# Shapes (height, width, channels): a single pixel, images narrower or shorter than the kernel, four channels,
+# and sizes that are not a multiple of the tile size
+SHAPES = [
+    (1, 1, 1),
+    (1, 1, 3),
+    (9, 1, 3),
+    (1, 9, 3),
+    (2, 300, 1),
+    (37, 53, 4),
+    (blur_numba.TILE_ROWS + 1, 1001, 3),
+    (3 * blur_numba.TILE_ROWS - 5, 2050, 1),
+]
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('ksize', [3, 5, 7])
+def test_sep_gauss_u8_matches_opencv(shape, ksize):
+    """
+    The Numba blur must give the same result as `cv2.sepFilter2D()` with replicated borders, up to rounding (1 LSB).
+    """
+    img = np.random.default_rng(ksize).integers(0, 256, shape, dtype=np.uint8)
+    k1d = cv2.getGaussianKernel(ksize, 0, cv2.CV_32F)
+    out = np.empty_like(img)
+    blur_numba.sep_gauss_u8(img, k1d.ravel(), out)
+
+    expected = cv2.sepFilter2D(img, -1, k1d, k1d, borderType=cv2.BORDER_REPLICATE).reshape(shape)
+    assert np.abs(out.astype(int) - expected).max() <= 1